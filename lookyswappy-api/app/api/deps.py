@@ -1,9 +1,45 @@
 from typing import Annotated
 
-from fastapi import Depends
+from fastapi import Depends, HTTPException, Request, Security, status
+from fastapi.security import APIKeyHeader
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
+from app.models.device import Device
+from app.services.auth_service import get_device
 
 # Database session dependency
 DBSession = Annotated[AsyncSession, Depends(get_db)]
+
+# Documents the bearer header in OpenAPI; the token is parsed by AuthMiddleware
+security = APIKeyHeader(name="Authorization", auto_error=False)
+
+
+async def get_current_device(
+    request: Request,
+    authorization: Annotated[str | None, Security(security)],
+    db: DBSession,
+) -> Device:
+    """Resolve the authenticated device from the bearer token.
+
+    The token itself is decoded once per request by AuthMiddleware;
+    the security scheme is only declared for the OpenAPI docs.
+    """
+    device_id = getattr(request.state, "device_id", None)
+    if device_id is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid or expired token",
+        )
+
+    device = await get_device(db, device_id)
+    if device is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Unknown device",
+        )
+    return device
+
+
+# Authenticated device dependency
+CurrentDevice = Annotated[Device, Depends(get_current_device)]
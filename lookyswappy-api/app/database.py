@@ -1,5 +1,6 @@
 from typing import AsyncGenerator
 
+from sqlalchemy import make_url
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.orm import DeclarativeBase
 
@@ -7,10 +8,21 @@ from app.config import get_settings
 
 settings = get_settings()
 
+# Prepared statement cache sizing is an asyncpg-specific connect argument
+_connect_args: dict[str, int] = {}
+if make_url(settings.database_url).get_driver_name() == "asyncpg":
+    _connect_args["statement_cache_size"] = settings.db_statement_cache_size
+
 engine = create_async_engine(
     settings.database_url,
     echo=settings.debug,
     future=True,
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+    pool_recycle=settings.db_pool_recycle,
+    pool_use_lifo=True,
+    pool_pre_ping=False,
+    connect_args=_connect_args,
 )
 
 async_session = async_sessionmaker(
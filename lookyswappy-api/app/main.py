@@ -3,9 +3,12 @@ from typing import AsyncGenerator
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from app.config import get_settings
 from app.api.v1.router import api_router
+from app.services.auth_service import verify_token_async
 
 settings = get_settings()
 
@@ -19,6 +22,30 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     print("Shutting down...")
 
 
+class AuthMiddleware:
+    """Decode the bearer token once per request.
+
+    The resulting device ID (or None) is stored on request.state for
+    the auth dependencies to read.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http":
+            device_id = None
+            for name, value in scope["headers"]:
+                if name == b"authorization":
+                    if value[:7].lower() == b"bearer ":
+                        token = value[7:].decode("latin-1")
+                        device_id = await verify_token_async(token)
+                    break
+            scope.setdefault("state", {})["device_id"] = device_id
+
+        await self.app(scope, receive, send)
+
+
 app = FastAPI(
     title=settings.app_name,
     lifespan=lifespan,
@@ -26,6 +53,12 @@ app = FastAPI(
     redoc_url="/redoc",
 )
 
+# Auth
+app.add_middleware(AuthMiddleware)
+
+# Compression (sync pull payloads are large, repetitive JSON)
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 # CORS
 app.add_middleware(
     CORSMiddleware,
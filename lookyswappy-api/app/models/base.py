@@ -2,8 +2,14 @@ from datetime import datetime
 from typing import Optional
 import uuid
 
-from sqlalchemy import Boolean, DateTime, String, func
-from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import Boolean, DateTime, String, Uuid, event, func
+from sqlalchemy.orm import (
+    Mapped,
+    ORMExecuteState,
+    Session,
+    mapped_column,
+    with_loader_criteria,
+)
 
 from app.database import Base
 
@@ -13,17 +19,41 @@ class SyncableBase(Base):
 
     __abstract__ = True
 
-    id: Mapped[str] = mapped_column(
-        String(36), primary_key=True, default=lambda: str(uuid.uuid4())
+    id: Mapped[uuid.UUID] = mapped_column(
+        Uuid, primary_key=True, server_default=func.gen_random_uuid()
     )
     client_id: Mapped[Optional[str]] = mapped_column(String(36), nullable=True)
     is_deleted: Mapped[bool] = mapped_column(Boolean, default=False)
+    # statement_timestamp() rather than now(): rows written by separate
+    # statements in one transaction get distinct sync cursor values
     last_modified: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
-        server_default=func.now(),
-        onupdate=func.now(),
+        server_default=func.statement_timestamp(),
+        onupdate=func.statement_timestamp(),
     )
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         server_default=func.now(),
     )
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _exclude_soft_deleted(execute_state: ORMExecuteState) -> None:
+    """Hide soft-deleted rows from ORM SELECTs.
+
+    Pass execution_options(include_deleted=True) to see them, e.g. when
+    pulling deletions for sync.
+    """
+    if (
+        execute_state.is_select
+        and not execute_state.is_column_load
+        and not execute_state.is_relationship_load
+        and not execute_state.execution_options.get("include_deleted", False)
+    ):
+        execute_state.statement = execute_state.statement.options(
+            with_loader_criteria(
+                SyncableBase,
+                lambda cls: cls.is_deleted.is_(False),
+                include_aliases=True,
+            )
+        )
@@ -1,6 +1,7 @@
 from datetime import datetime
+import uuid
 
-from sqlalchemy import DateTime, String, func
+from sqlalchemy import DateTime, String, Uuid, func
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.database import Base
@@ -11,7 +12,10 @@ class Device(Base):
 
     __tablename__ = "devices"
 
-    id: Mapped[str] = mapped_column(String(36), primary_key=True)
+    id: Mapped[uuid.UUID] = mapped_column(
+        Uuid, primary_key=True, server_default=func.gen_random_uuid()
+    )
+    device_id: Mapped[str] = mapped_column(String(64), unique=True, nullable=False)
     last_seen: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         server_default=func.now(),
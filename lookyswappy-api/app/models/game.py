@@ -1,8 +1,18 @@
 from datetime import datetime
 from enum import Enum
 from typing import Optional
+import uuid
 
-from sqlalchemy import DateTime, Integer, String
+from sqlalchemy import (
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    SmallInteger,
+    String,
+    Uuid,
+    text,
+)
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.models.base import SyncableBase
@@ -17,11 +27,30 @@ class Game(SyncableBase):
     """Game model representing a Lookyswappy game session."""
 
     __tablename__ = "games"
+    __table_args__ = (
+        Index(
+            "ix_games_device_lastmod",
+            "device_id",
+            "last_modified",
+            postgresql_include=["id", "is_deleted"],
+        ),
+        Index(
+            "ix_games_device_active",
+            "device_id",
+            postgresql_where=text("is_deleted IS FALSE"),
+        ),
+    )
+
+    STATUS_IN_PROGRESS = 0
+    STATUS_COMPLETED = 1
 
+    device_id: Mapped[uuid.UUID] = mapped_column(
+        Uuid, ForeignKey("devices.id"), nullable=False
+    )
     name: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
     target_score: Mapped[int] = mapped_column(Integer, default=100)
-    status: Mapped[str] = mapped_column(String(20), default=GameStatus.IN_PROGRESS)
-    winner_id: Mapped[Optional[str]] = mapped_column(String(36), nullable=True)
+    status: Mapped[int] = mapped_column(SmallInteger, default=STATUS_IN_PROGRESS)
+    winner_id: Mapped[Optional[uuid.UUID]] = mapped_column(Uuid, nullable=True)
     completed_at: Mapped[Optional[datetime]] = mapped_column(
         DateTime(timezone=True), nullable=True
     )
@@ -33,3 +62,10 @@ class Game(SyncableBase):
     rounds: Mapped[list["Round"]] = relationship(  # noqa: F821
         "Round", back_populates="game", cascade="all, delete-orphan"
     )
+
+
+# Game.status is stored as a SMALLINT code; this maps codes to wire values
+GAME_STATUS_NAMES: dict[int, GameStatus] = {
+    Game.STATUS_IN_PROGRESS: GameStatus.IN_PROGRESS,
+    Game.STATUS_COMPLETED: GameStatus.COMPLETED,
+}
@@ -1,4 +1,6 @@
-from sqlalchemy import ForeignKey, Integer, String
+import uuid
+
+from sqlalchemy import ForeignKey, Index, Integer, String, Uuid
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.models.base import SyncableBase
@@ -8,9 +10,12 @@ class GamePlayer(SyncableBase):
     """Player in a specific game."""
 
     __tablename__ = "game_players"
+    __table_args__ = (
+        Index("ix_game_players_game_lastmod", "game_id", "last_modified"),
+    )
 
-    game_id: Mapped[str] = mapped_column(
-        String(36), ForeignKey("games.id"), nullable=False
+    game_id: Mapped[uuid.UUID] = mapped_column(
+        Uuid, ForeignKey("games.id"), nullable=False
     )
     name: Mapped[str] = mapped_column(String(50), nullable=False)
     position: Mapped[int] = mapped_column(Integer, nullable=False)
@@ -1,4 +1,6 @@
-from sqlalchemy import ForeignKey, Integer, String
+import uuid
+
+from sqlalchemy import ForeignKey, Index, Integer, Uuid, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.models.base import SyncableBase
@@ -8,9 +10,17 @@ class Round(SyncableBase):
     """A round within a game."""
 
     __tablename__ = "rounds"
+    __table_args__ = (
+        Index("ix_rounds_game_lastmod", "game_id", "last_modified"),
+        Index(
+            "ix_rounds_game_active",
+            "game_id",
+            postgresql_where=text("is_deleted IS FALSE"),
+        ),
+    )
 
-    game_id: Mapped[str] = mapped_column(
-        String(36), ForeignKey("games.id"), nullable=False
+    game_id: Mapped[uuid.UUID] = mapped_column(
+        Uuid, ForeignKey("games.id"), nullable=False
     )
     round_number: Mapped[int] = mapped_column(Integer, nullable=False)
 
@@ -1,4 +1,6 @@
-from sqlalchemy import Boolean, ForeignKey, Integer, String
+import uuid
+
+from sqlalchemy import Boolean, ForeignKey, Index, Integer, Uuid
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.models.base import SyncableBase
@@ -8,12 +10,15 @@ class Score(SyncableBase):
     """Score for a player in a specific round."""
 
     __tablename__ = "scores"
+    __table_args__ = (
+        Index("ix_scores_round_lastmod", "round_id", "last_modified"),
+    )
 
-    round_id: Mapped[str] = mapped_column(
-        String(36), ForeignKey("rounds.id"), nullable=False
+    round_id: Mapped[uuid.UUID] = mapped_column(
+        Uuid, ForeignKey("rounds.id"), nullable=False
     )
-    player_id: Mapped[str] = mapped_column(
-        String(36), ForeignKey("game_players.id"), nullable=False
+    player_id: Mapped[uuid.UUID] = mapped_column(
+        Uuid, ForeignKey("game_players.id"), nullable=False
     )
     raw_score: Mapped[int] = mapped_column(Integer, nullable=False)
     bonus_applied: Mapped[bool] = mapped_column(Boolean, default=False)
@@ -1,7 +1,10 @@
 from datetime import datetime
 from typing import Optional
+import uuid
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, field_validator
+
+from app.models.game import GAME_STATUS_NAMES
 
 
 class GameBase(BaseModel):
@@ -20,11 +23,21 @@ class GameCreate(GameBase):
 class GameResponse(GameBase):
     """Schema for game response."""
 
-    id: str
+    model_config = ConfigDict(from_attributes=True)
+
+    id: uuid.UUID
     status: str
-    winner_id: Optional[str] = None
+    winner_id: Optional[uuid.UUID] = None
     completed_at: Optional[datetime] = None
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    @field_validator("status", mode="before")
+    @classmethod
+    def status_from_code(cls, value: object) -> object:
+        """Map the stored SMALLINT status code to its wire value."""
+        if isinstance(value, int):
+            try:
+                return GAME_STATUS_NAMES[value].value
+            except KeyError:
+                raise ValueError(f"unknown game status code {value}") from None
+        return value
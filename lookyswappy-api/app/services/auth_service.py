@@ -1,11 +1,128 @@
+import asyncio
+import base64
+import hashlib
+import hmac
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
+from hashlib import blake2b
+from typing import Any
 
-from jose import jwt
+import jwt
+import orjson
+from cachetools import TTLCache
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import make_transient_to_detached
 
 from app.config import get_settings
+from app.models.device import Device
 
 settings = get_settings()
 
+_JWT_SECRET = settings.jwt_secret
+_JWT_ALG = settings.jwt_algorithm
+_JWT_EXPIRE_DELTA = timedelta(days=settings.jwt_expire_days)
+_JWT_EXPIRE_SECONDS = int(_JWT_EXPIRE_DELTA.total_seconds())
+
+_HMAC_DIGESTS = {
+    "HS256": hashlib.sha256,
+    "HS384": hashlib.sha384,
+    "HS512": hashlib.sha512,
+}
+
+# Keyed HMAC state, copied per token so the key schedule is computed once
+_HMAC_PROTO = hmac.new(_JWT_SECRET.encode(), None, _HMAC_DIGESTS[_JWT_ALG])
+
+# Verified tokens, keyed by a short digest of the token: (device_id, exp)
+_token_cache: TTLCache[bytes, tuple[str, int]] = TTLCache(maxsize=10_000, ttl=300)
+
+# Known devices, so steady-state auth skips the database entirely
+_device_cache: TTLCache[str, Device] = TTLCache(maxsize=10_000, ttl=60)
+
+# Optional pool for verifying uncached tokens off the event loop
+_jwt_pool: ThreadPoolExecutor | None = (
+    ThreadPoolExecutor(max_workers=2, thread_name_prefix="jwt")
+    if settings.jwt_decode_offload
+    else None
+)
+
+
+def _token_key(token: str) -> bytes:
+    return blake2b(token.encode(), digest_size=16).digest()
+
+
+def _b64url_decode(segment: str) -> bytes:
+    return base64.b64decode(
+        segment + "=" * (-len(segment) % 4), altchars=b"-_", validate=True
+    )
+
+
+def _decode_token(token: str) -> dict[str, Any] | None:
+    """Verify an HMAC-signed JWT and return its claims.
+
+    Checks the header algorithm, the signature, the exp and nbf claims
+    and that sub is a string; claims are parsed with orjson.
+
+    Returns:
+        Claims if valid, None otherwise
+    """
+    try:
+        header_b64, payload_b64, signature_b64 = token.split(".")
+        signing_input = f"{header_b64}.{payload_b64}"
+
+        header = orjson.loads(_b64url_decode(header_b64))
+        if not isinstance(header, dict):
+            return None
+        if header.get("alg") != _JWT_ALG:
+            return None
+
+        mac = _HMAC_PROTO.copy()
+        mac.update(signing_input.encode("ascii"))
+        # Compare the encoded text so only the canonical spelling verifies
+        expected = base64.urlsafe_b64encode(mac.digest()).rstrip(b"=")
+        if not hmac.compare_digest(expected, signature_b64.encode("ascii")):
+            return None
+
+        payload = orjson.loads(_b64url_decode(payload_b64))
+    except ValueError:
+        return None
+
+    if not isinstance(payload, dict):
+        return None
+    exp = payload.get("exp")
+    now = time.time()
+    if not isinstance(exp, (int, float)) or exp <= now:
+        return None
+    nbf = payload.get("nbf", 0)
+    if not isinstance(nbf, (int, float)) or nbf > now:
+        return None
+    if not isinstance(payload.get("sub"), str):
+        return None
+    return payload
+
+
+def _remember_token(key: bytes, payload: dict[str, Any] | None) -> str | None:
+    if payload is None:
+        return None
+
+    device_id = payload["sub"]
+    _token_cache[key] = (device_id, payload["exp"])
+    return device_id
+
+
+def _verify_token(token: str, key: bytes) -> str | None:
+    cached = _token_cache.get(key)
+    if cached is not None:
+        device_id, exp = cached
+        if exp > time.time():
+            return device_id
+        _token_cache.pop(key, None)
+        return None
+
+    return _remember_token(key, _decode_token(token))
+
 
 def create_access_token(device_id: str) -> tuple[str, int]:
     """Create a JWT access token for a device.
@@ -13,37 +130,82 @@ def create_access_token(device_id: str) -> tuple[str, int]:
     Returns:
         Tuple of (token, expires_in_seconds)
     """
-    expires_delta = timedelta(days=settings.jwt_expire_days)
-    expire = datetime.now(timezone.utc) + expires_delta
+    now = datetime.now(timezone.utc)
 
     to_encode = {
         "sub": device_id,
-        "exp": expire,
-        "iat": datetime.now(timezone.utc),
+        "exp": now + _JWT_EXPIRE_DELTA,
+        "iat": now,
     }
 
     token = jwt.encode(
         to_encode,
-        settings.jwt_secret,
-        algorithm=settings.jwt_algorithm,
+        _JWT_SECRET,
+        algorithm=_JWT_ALG,
     )
 
-    expires_in = int(expires_delta.total_seconds())
-    return token, expires_in
+    return token, _JWT_EXPIRE_SECONDS
 
 
 def verify_token(token: str) -> str | None:
     """Verify a JWT token and return the device ID.
 
+    Recently verified tokens are served from an in-process cache until
+    their own expiry.
+
     Returns:
         Device ID if valid, None otherwise
     """
-    try:
-        payload = jwt.decode(
-            token,
-            settings.jwt_secret,
-            algorithms=[settings.jwt_algorithm],
-        )
-        return payload.get("sub")
-    except jwt.JWTError:
-        return None
+    return _verify_token(token, _token_key(token))
+
+
+async def verify_token_async(token: str) -> str | None:
+    """Verify a JWT token, optionally off the event loop.
+
+    With jwt_decode_offload enabled, tokens missing from the cache are
+    verified on a small dedicated thread pool; otherwise this is the
+    same as verify_token.
+
+    Returns:
+        Device ID if valid, None otherwise
+    """
+    key = _token_key(token)
+    if _jwt_pool is None or key in _token_cache:
+        return _verify_token(token, key)
+
+    loop = asyncio.get_running_loop()
+    payload = await loop.run_in_executor(_jwt_pool, _decode_token, token)
+    return _remember_token(key, payload)
+
+
+async def get_device(db: AsyncSession, device_id: str) -> Device | None:
+    """Look up a device by ID, using a short-lived in-process cache.
+
+    The returned Device is a detached copy loaded apart from the
+    session's identity map, since cached instances are shared between
+    requests; use db.merge(device, load=False) to get a session-bound
+    copy before modifying it.
+
+    Returns:
+        Device if registered, None otherwise
+    """
+    device = _device_cache.get(device_id)
+    if device is None:
+        try:
+            pk = uuid.UUID(device_id)
+        except (TypeError, ValueError):
+            # e.g. tokens issued with the client-supplied device ID as subject
+            return None
+
+        # Select plain columns so any instance the session already holds
+        # for this row stays attached and untouched
+        table = Device.__table__
+        result = await db.execute(select(table).where(table.c.id == pk))
+        row = result.first()
+        if row is None:
+            return None
+
+        device = Device(**row._mapping)
+        make_transient_to_detached(device)
+        _device_cache[device_id] = device
+    return device
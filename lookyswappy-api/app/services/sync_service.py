@@ -1,6 +1,17 @@
+import time
 from datetime import datetime
 
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from app.models import Game, Round
+
+# Loader options for pull_changes to pass explicitly once it queries game trees;
+# relationships stay lazy by default, so nothing applies these implicitly.
+PULL_LOAD_OPTIONS = (
+    selectinload(Game.players),
+    selectinload(Game.rounds).selectinload(Round.scores),
+)
 
 
 async def pull_changes(
@@ -26,7 +37,7 @@ async def pull_changes(
             "rounds": {"created": [], "updated": [], "deleted": []},
             "scores": {"created": [], "updated": [], "deleted": []},
         },
-        "timestamp": datetime.now().timestamp(),
+        "timestamp": time.time(),
     }
 
 
@@ -1,6 +1,12 @@
+import uuid
+from datetime import datetime, timezone
+
 import pytest
 from httpx import AsyncClient, ASGITransport
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
+from app.database import Base
 from app.main import app
 
 
@@ -16,3 +22,28 @@ async def client() -> AsyncClient:
         base_url="http://test",
     ) as client:
         yield client
+
+
+def _register_postgres_functions(dbapi_connection, connection_record) -> None:
+    """Stand in for the Postgres functions used as server defaults."""
+
+    def timestamp() -> str:
+        return datetime.now(timezone.utc).isoformat(sep=" ")
+
+    dbapi_connection.create_function("gen_random_uuid", 0, lambda: uuid.uuid4().hex)
+    dbapi_connection.create_function("statement_timestamp", 0, timestamp)
+
+
+@pytest.fixture
+async def db() -> AsyncSession:
+    """Session on a fresh in-memory SQLite database with all tables."""
+    engine = create_async_engine("sqlite+aiosqlite://")
+    event.listen(engine.sync_engine, "connect", _register_postgres_functions)
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    async with async_sessionmaker(engine, expire_on_commit=False)() as session:
+        yield session
+
+    await engine.dispose()
@@ -0,0 +1,169 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import jwt
+import pytest
+from sqlalchemy import inspect
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import get_settings
+from app.models import Device
+from app.services import auth_service
+from app.services.auth_service import (
+    create_access_token,
+    get_device,
+    verify_token,
+    verify_token_async,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_device_cache() -> None:
+    auth_service._device_cache.clear()
+
+
+def test_token_round_trip() -> None:
+    """Test a freshly issued token verifies to its device ID."""
+    token, expires_in = create_access_token("device-123")
+    assert verify_token(token) == "device-123"
+    assert expires_in > 0
+
+
+def test_tampered_token_rejected() -> None:
+    """Test a token with a modified signature does not verify."""
+    token, _ = create_access_token("device-123")
+    header, payload, signature = token.split(".")
+    tampered = f"{header}.{payload}.{signature[::-1]}"
+    assert verify_token(tampered) is None
+
+
+def test_cached_token_honours_expiry() -> None:
+    """Test a cached token is rejected once its exp claim has passed."""
+    token, _ = create_access_token("device-123")
+    assert verify_token(token) == "device-123"
+
+    key = auth_service._token_key(token)
+    auth_service._token_cache[key] = ("device-123", 0)
+    assert verify_token(token) is None
+
+
+def test_unsigned_token_rejected() -> None:
+    """Test a token using the 'none' algorithm does not verify."""
+    token = jwt.encode({"sub": "device-123", "exp": 2**31}, None, algorithm="none")
+    assert verify_token(token) is None
+
+
+def test_expired_token_rejected() -> None:
+    """Test a correctly signed but expired token does not verify."""
+    settings = get_settings()
+    token = jwt.encode(
+        {"sub": "device-123", "exp": 1},
+        settings.jwt_secret,
+        algorithm=settings.jwt_algorithm,
+    )
+    assert verify_token(token) is None
+
+
+@pytest.mark.parametrize("sub", [123, ["device-123"], None])
+def test_non_string_subject_rejected(sub: object) -> None:
+    """Test a signed token whose sub claim is not a string does not verify."""
+    settings = get_settings()
+    claims = {"sub": sub, "exp": 2**31}
+    token = jwt.encode(claims, settings.jwt_secret, algorithm=settings.jwt_algorithm)
+    assert verify_token(token) is None
+
+
+def test_not_yet_valid_token_rejected() -> None:
+    """Test a signed token with a future nbf claim does not verify."""
+    settings = get_settings()
+    token = jwt.encode(
+        {"sub": "device-123", "exp": 2**31, "nbf": 2**31 - 1},
+        settings.jwt_secret,
+        algorithm=settings.jwt_algorithm,
+    )
+    assert verify_token(token) is None
+
+
+@pytest.mark.anyio
+async def test_offloaded_verification(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test tokens verified on the offload pool resolve and get cached."""
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        monkeypatch.setattr(auth_service, "_jwt_pool", pool)
+        token, _ = create_access_token("device-456")
+        assert await verify_token_async(token) == "device-456"
+        assert auth_service._token_key(token) in auth_service._token_cache
+
+
+@pytest.mark.anyio
+async def test_get_device_caches_detached_instance(db: AsyncSession) -> None:
+    """Test devices are cached detached and served from the cache."""
+    device = Device(device_id="client-device")
+    db.add(device)
+    await db.commit()
+    device_id = str(device.id)
+    db.expunge_all()
+
+    found = await get_device(db, device_id)
+    assert found is not None
+    assert inspect(found).detached
+    assert found.device_id == "client-device"
+    assert await get_device(db, device_id) is found
+
+    merged = await db.merge(found, load=False)
+    assert merged is not found
+    assert merged in db
+
+
+@pytest.mark.anyio
+async def test_get_device_leaves_session_instance_attached(db: AsyncSession) -> None:
+    """Test looking up a device the session holds does not detach it."""
+    device = Device(device_id="client-device")
+    db.add(device)
+    await db.commit()
+
+    found = await get_device(db, str(device.id))
+    assert found is not device
+    assert device in db
+
+    device.device_id = "renamed-device"
+    await db.commit()
+    db.expunge_all()
+
+    reloaded = await db.get(Device, device.id)
+    assert reloaded.device_id == "renamed-device"
+
+
+@pytest.mark.anyio
+async def test_get_device_unknown(db: AsyncSession) -> None:
+    """Test an unregistered device ID resolves to None and is not cached."""
+    assert await get_device(db, "00000000-0000-0000-0000-000000000000") is None
+    assert len(auth_service._device_cache) == 0
+
+
+@pytest.mark.anyio
+async def test_get_device_non_uuid_subject(db: AsyncSession) -> None:
+    """Test a token subject that is not a UUID resolves to None."""
+    assert await get_device(db, "device-123") is None
+
+
+def test_non_canonical_token_rejected() -> None:
+    """Test only the canonical spelling of a signed token verifies."""
+    token, _ = create_access_token("device-123")
+    assert verify_token(token + "!!") is None
+    assert verify_token(token + ".extra") is None
+
+    signing_input, signature = token.rsplit(".", 1)
+    standard = signature.replace("-", "+").replace("_", "/")
+    variants = [standard, signature + "=", signature + "=="]
+
+    # The last character of a 43-char signature carries 2 unused low bits
+    alphabet = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-_"
+    base = alphabet.index(signature[-1]) & ~0b11
+    variants += [
+        signature[:-1] + alphabet[base + low]
+        for low in range(4)
+        if alphabet[base + low] != signature[-1]
+    ]
+
+    for variant in variants:
+        if variant != signature:
+            assert verify_token(f"{signing_input}.{variant}") is None
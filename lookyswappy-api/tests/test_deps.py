@@ -0,0 +1,75 @@
+import pytest
+from fastapi import Request
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.deps import CurrentDevice
+from app.database import get_db
+from app.main import app
+from app.models import Device
+from app.services import auth_service
+from app.services.auth_service import create_access_token
+
+
+@pytest.fixture
+async def whoami(db: AsyncSession) -> str:
+    """Mount an authenticated route backed by the test database."""
+
+    async def whoami(request: Request, device: CurrentDevice) -> dict[str, str]:
+        return {"state": request.state.device_id, "device": str(device.id)}
+
+    async def override_get_db():
+        yield db
+
+    app.add_api_route("/test/whoami", whoami)
+    route = app.router.routes[-1]
+    app.dependency_overrides[get_db] = override_get_db
+    auth_service._device_cache.clear()
+
+    yield "/test/whoami"
+
+    app.dependency_overrides.pop(get_db)
+    app.router.routes.remove(route)
+
+
+@pytest.mark.anyio
+async def test_valid_token(client: AsyncClient, db: AsyncSession, whoami: str) -> None:
+    """Test a valid token resolves the device via request.state."""
+    device = Device(device_id="client-device")
+    db.add(device)
+    await db.commit()
+    token, _ = create_access_token(str(device.id))
+
+    response = await client.get(whoami, headers={"Authorization": f"Bearer {token}"})
+    assert response.status_code == 200
+    assert response.json() == {"state": str(device.id), "device": str(device.id)}
+
+
+@pytest.mark.anyio
+async def test_bad_token(client: AsyncClient, whoami: str) -> None:
+    """Test an invalid bearer token is rejected with 401."""
+    response = await client.get(whoami, headers={"Authorization": "Bearer junk"})
+    assert response.status_code == 401
+
+
+@pytest.mark.anyio
+async def test_non_uuid_subject(client: AsyncClient, whoami: str) -> None:
+    """Test a signed token for a client-supplied device ID is a 401, not a 500."""
+    token, _ = create_access_token("device-123")
+    response = await client.get(whoami, headers={"Authorization": f"Bearer {token}"})
+    assert response.status_code == 401
+
+
+@pytest.mark.anyio
+async def test_missing_header(client: AsyncClient, whoami: str) -> None:
+    """Test a request without an Authorization header gets 401, not 403."""
+    response = await client.get(whoami)
+    assert response.status_code == 401
+
+
+@pytest.mark.anyio
+async def test_non_bearer_scheme(client: AsyncClient, whoami: str) -> None:
+    """Test a non-Bearer Authorization scheme gets 401."""
+    token, _ = create_access_token("00000000-0000-0000-0000-000000000000")
+    response = await client.get(whoami, headers={"Authorization": f"Basic {token}"})
+    assert response.status_code == 401
@@ -0,0 +1,65 @@
+import pytest
+from sqlalchemy import inspect, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from app.models import Device, Game, Round
+
+
+async def add_game_tree(db: AsyncSession) -> None:
+    """Insert a device with one game containing one round."""
+    device = Device(device_id="client-device")
+    db.add(device)
+    await db.flush()
+
+    game = Game(device_id=device.id)
+    db.add(game)
+    await db.flush()
+
+    db.add(Round(game_id=game.id, round_number=1))
+    await db.commit()
+    db.expunge_all()
+
+
+@pytest.mark.anyio
+async def test_game_collections_load_lazily(db: AsyncSession) -> None:
+    """Test a plain Game load does not pull in its players or rounds."""
+    await add_game_tree(db)
+
+    game = (await db.execute(select(Game))).scalar_one()
+    assert {"players", "rounds"} <= inspect(game).unloaded
+
+
+@pytest.mark.anyio
+async def test_soft_deleted_rows_are_hidden(db: AsyncSession) -> None:
+    """Test soft-deleted rows are filtered from queries, gets and eager loads."""
+    device = Device(device_id="client-device")
+    db.add(device)
+    await db.flush()
+
+    active = Game(device_id=device.id, name="active")
+    deleted = Game(device_id=device.id, name="deleted", is_deleted=True)
+    db.add_all([active, deleted])
+    await db.flush()
+
+    db.add_all(
+        [
+            Round(game_id=active.id, round_number=1),
+            Round(game_id=active.id, round_number=2, is_deleted=True),
+        ]
+    )
+    await db.commit()
+    deleted_id = deleted.id
+    db.expunge_all()
+
+    query = select(Game).options(selectinload(Game.rounds))
+    [game] = (await db.execute(query)).scalars().all()
+    assert game.name == "active"
+    assert [r.round_number for r in game.rounds] == [1]
+
+    assert await db.get(Game, deleted_id) is None
+
+    everything = select(Game).execution_options(include_deleted=True)
+    names = {g.name for g in (await db.execute(everything)).scalars()}
+    assert names == {"active", "deleted"}
+
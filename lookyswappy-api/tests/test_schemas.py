@@ -0,0 +1,31 @@
+from datetime import datetime, timezone
+import uuid
+
+import pytest
+from pydantic import ValidationError
+
+from app.models import Game
+from app.schemas.game import GameResponse
+
+
+def make_game(status: int) -> Game:
+    return Game(
+        id=uuid.uuid4(),
+        status=status,
+        target_score=100,
+        created_at=datetime.now(timezone.utc),
+    )
+
+
+def test_game_response_maps_status_codes() -> None:
+    """Test stored status codes serialise to their string wire values."""
+    in_progress = GameResponse.model_validate(make_game(Game.STATUS_IN_PROGRESS))
+    completed = GameResponse.model_validate(make_game(Game.STATUS_COMPLETED))
+    assert in_progress.status == "in_progress"
+    assert completed.status == "completed"
+
+
+def test_game_response_rejects_unknown_status_code() -> None:
+    """Test an unknown status code is a validation error, not a KeyError."""
+    with pytest.raises(ValidationError):
+        GameResponse.model_validate(make_game(7))
@@ -0,0 +1,34 @@
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import Device, Game, GamePlayer, Round, Score
+from app.services.sync_service import PULL_LOAD_OPTIONS
+
+
+@pytest.mark.anyio
+async def test_pull_load_options_load_game_tree(db: AsyncSession) -> None:
+    """Test the pull loader options eagerly load players, rounds and scores."""
+    device = Device(device_id="client-device")
+    db.add(device)
+    await db.flush()
+
+    game = Game(device_id=device.id)
+    db.add(game)
+    await db.flush()
+
+    player = GamePlayer(game_id=game.id, name="Sam", position=0)
+    round_ = Round(game_id=game.id, round_number=1)
+    db.add_all([player, round_])
+    await db.flush()
+
+    db.add(Score(round_id=round_.id, player_id=player.id, raw_score=5, final_score=5))
+    await db.commit()
+    db.expunge_all()
+
+    game = (await db.execute(select(Game).options(*PULL_LOAD_OPTIONS))).scalar_one()
+    db.expunge_all()
+
+    assert [p.name for p in game.players] == ["Sam"]
+    assert [r.round_number for r in game.rounds] == [1]
+    assert [s.final_score for s in game.rounds[0].scores] == [5]